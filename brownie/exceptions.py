@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 
 import sys
-from typing import Optional, Type
+from typing import Optional, Tuple, Type, Union
 
 import eth_abi
 import psutil
@@ -174,13 +174,22 @@ class BadProjectName(Exception):
 
 
 class CompilerError(Exception):
-    def __init__(self, e: Type[psutil.Popen], compiler: str = "Compiler") -> None:
+    def __init__(self, e: Union[Type[psutil.Popen], str], compiler: str = "Compiler") -> None:
         self.compiler = compiler
 
+        if isinstance(e, str):
+            # a pre-formatted message, e.g. when unpickled from a subprocess
+            super().__init__(e)
+            return
+
         err_json = yaml.safe_load(e.stdout_data)
         err = [i.get("formattedMessage") or i["message"] for i in err_json["errors"]]
         super().__init__(f"{compiler} returned the following errors:\n\n" + "\n".join(err))
 
+    def __reduce__(self) -> Tuple:
+        # so instances raised during a subprocess compile survive pickling
+        return (type(self), (str(self), self.compiler))
+
 
 class IncompatibleSolcVersion(Exception):
     pass
@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 
 import json
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from hashlib import sha1
 from pathlib import Path
@@ -10,7 +11,7 @@ import solcast
 from eth_utils import remove_0x_prefix
 from semantic_version import Version
 
-from brownie._config import _get_data_folder
+from brownie._config import EVM_EQUIVALENTS, _get_data_folder
 from brownie.exceptions import UnsupportedLanguage
 from brownie.project import sources
 from brownie.project.compiler.solidity import (  # NOQA: F401
@@ -110,6 +111,9 @@ def compile_and_format(
         if optimizer is None:
             optimizer = {"enabled": optimize, "runs": runs if optimize else 0}
 
+    # prepare a compile job per target version - the active compiler version
+    # affects input json generation, so it is set while building each job
+    compiler_jobs = []
     for version, path_list in compiler_targets.items():
         compiler_data: Dict = {}
         if path_list[0].endswith(".vy"):
@@ -137,13 +141,53 @@ def compile_and_format(
             remappings=remappings,
             optimizer=optimizer,
         )
-
-        output_json = compile_from_input_json(input_json, silent, allow_paths)
+        compiler_jobs.append((version, language, compiler_data, input_json))
+
+    if silent and len(compiler_jobs) > 1:
+        # multiple target versions compile in parallel subprocesses
+        with ProcessPoolExecutor() as executor:
+            futures = [
+                executor.submit(_compile_in_subprocess, version, language, input_json, allow_paths)
+                for version, language, _, input_json in compiler_jobs
+            ]
+            output_jsons = [i.result() for i in futures]
+    else:
+        # the active version also affects compilation itself, so when running
+        # serially it is set again before each job
+        output_jsons = []
+        for version, language, _, input_json in compiler_jobs:
+            if language == "Vyper":
+                set_vyper_version(version)
+            else:
+                set_solc_version(version)
+            output_jsons.append(compile_from_input_json(input_json, silent, allow_paths))
+
+    for (version, language, compiler_data, input_json), output_json in zip(
+        compiler_jobs, output_jsons
+    ):
+        # coverage generation queries the active compiler version, so it must
+        # be set again when the jobs did not run serially
+        if language == "Vyper":
+            set_vyper_version(version)
+        else:
+            set_solc_version(version)
         build_json.update(generate_build_json(input_json, output_json, compiler_data, silent))
 
     return build_json
 
 
+def _compile_in_subprocess(
+    version: str, language: str, input_json: Dict, allow_paths: Optional[str]
+) -> Dict:
+    # worker for parallel compilation - the compiler version is process-global
+    # state, so each subprocess sets its own before compiling
+    if language == "Vyper":
+        set_vyper_version(version)
+    else:
+        set_solc_version(version)
+    return compile_from_input_json(input_json, True, allow_paths)
+
+
 def generate_input_json(
     contract_sources: Dict[str, str],
     optimize: bool = True,
@@ -181,6 +225,10 @@ def generate_input_json(
             evm_version = next(i[0] for i in EVM_SOLC_VERSIONS if solidity.get_version() >= i[1])
         else:
             evm_version = "istanbul"
+    elif evm_version in EVM_EQUIVALENTS:
+        # normalize here so the build json records the same version regardless
+        # of whether compilation happens in this process or a subprocess
+        evm_version = EVM_EQUIVALENTS[evm_version]
 
     input_json: Dict = deepcopy(STANDARD_JSON)
     input_json["language"] = language
@@ -1,6 +1,9 @@
 #!/usr/bin/python3
 
 import logging
+import re
+import time
+from bisect import bisect_left
 from collections import deque
 from hashlib import sha1
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
@@ -26,6 +29,27 @@ solcx_logger.addHandler(sh)
 
 AVAILABLE_SOLC_VERSIONS = None
 
+# cached result of solcx.get_installed_solc_versions, which hits the
+# filesystem on every call - invalidated on install and after a short TTL
+# in case versions are installed outside of brownie
+_INSTALLED_SOLC_VERSIONS: Optional[List] = None
+_INSTALLED_SOLC_VERSIONS_EXPIRY: float = 0.0
+_INSTALLED_SOLC_VERSIONS_TTL = 60
+
+# opcode and filter constants used within the coverage generation hot loop
+_JUMP_OPS = frozenset(("JUMP", "JUMPI"))
+_TERMINAL_OPS = frozenset(("INVALID", "STOP"))
+_REVERT_FN_NAMES = frozenset(("revert", "require"))
+_REVERT_CALL_FILTERS = (
+    {"nodeType": "FunctionCall", "expression.name": "revert"},
+    {"nodeType": "FunctionCall", "expression.name": "require"},
+)
+_BRANCH_BASE_FILTERS = (
+    {"nodeType": "FunctionCall", "expression.name": "require"},
+    {"nodeType": "IfStatement"},
+    {"nodeType": "Conditional"},
+)
+
 # error codes used in Solidity >=0.8.0
 # docs.soliditylang.org/en/v0.8.0/control-structures.html#panic-via-assert-and-error-via-require
 SOLIDITY_ERROR_CODES = {
@@ -101,22 +125,46 @@ def set_solc_version(version: Union[str, Version]) -> str:
 
 def install_solc(*versions: Union[Version, str]) -> None:
     """Installs solc versions."""
+    global _INSTALLED_SOLC_VERSIONS
     for version in versions:
         solcx.install_solc(version, show_progress=True)
+    _INSTALLED_SOLC_VERSIONS = None
 
 
-def get_abi(contract_source: str, allow_paths: Optional[str] = None) -> Dict:
+def get_abi(contract_source: Union[str, Dict[str, str]], allow_paths: Optional[str] = None) -> Dict:
     """
     Given a contract source, returns a dict of {name: abi}
 
+    Given a dict of {path: source}, the sources are compiled together in a
+    single invocation per required solc version, and a dict in the form of
+    {path: {name: abi}} is returned.
+
     This function is deprecated in favor of `brownie.project.compiler.get_abi`
     """
-    version = find_best_solc_version({"<stdin>": contract_source})
-    set_solc_version(version)
-    compiled = solcx.compile_source(
-        contract_source, allow_empty=True, allow_paths=allow_paths, output_values=["abi"]
-    )
-    return {k.rsplit(":")[-1]: v["abi"] for k, v in compiled.items()}
+    if isinstance(contract_source, str):
+        version = find_best_solc_version({"<stdin>": contract_source})
+        set_solc_version(version)
+        compiled = solcx.compile_source(
+            contract_source, allow_empty=True, allow_paths=allow_paths, output_values=["abi"]
+        )
+        return {k.rsplit(":")[-1]: v["abi"] for k, v in compiled.items()}
+
+    final_output: Dict = {path: {} for path in contract_source}
+    for version, path_list in find_solc_versions(contract_source).items():
+        set_solc_version(version)
+        input_json = {
+            "language": "Solidity",
+            "sources": {path: {"content": contract_source[path]} for path in path_list},
+            "settings": {
+                "optimizer": {"enabled": False, "runs": 0},
+                "outputSelection": {"*": {"*": ["abi"]}},
+            },
+        }
+        output_json = compile_from_input_json(input_json, allow_paths=allow_paths)
+        output_contracts = output_json.get("contracts", {})
+        for path in [i for i in path_list if i in output_contracts]:
+            final_output[path] = {k: v["abi"] for k, v in output_contracts[path].items()}
+    return final_output
 
 
 def find_solc_versions(
@@ -171,7 +219,7 @@ def find_solc_versions(
     # install new versions if needed
     if to_install:
         install_solc(*to_install)
-        installed_versions = solcx.get_installed_solc_versions()
+        installed_versions = _get_solc_version_list()[1]
     elif new_versions and not silent:
         print(
             f"New compatible solc version{'s' if len(new_versions) > 1 else ''}"
@@ -210,11 +258,38 @@ def find_best_solc_version(
 
     available_versions, installed_versions = _get_solc_version_list()
 
-    for path, source in contract_sources.items():
-
+    if len(contract_sources) == 1:
+        # with a single source there is no cross-source intersection to take,
+        # the best version can be selected from the pragma spec directly
+        path, source = next(iter(contract_sources.items()))
         pragma_spec = sources.get_pragma_spec(source, path)
-        installed_versions = [i for i in installed_versions if i in pragma_spec]
-        available_versions = [i for i in available_versions if i in pragma_spec]
+
+        latest = pragma_spec.select(available_versions)
+        if not latest:
+            raise IncompatibleSolcVersion(
+                "No installable solc version compatible across all sources"
+            )
+        version = pragma_spec.select(installed_versions)
+        if not version and not (install_needed or install_latest):
+            raise IncompatibleSolcVersion("No installed solc version compatible across all sources")
+
+        if latest > (version or Version("0.0.0")):
+            if install_latest or (install_needed and not version):
+                install_solc(latest)
+                return str(latest)
+            if not silent:
+                print(f"New compatible solc version available: {latest}")
+
+        return str(version)
+
+    # gather all pragma specs up front and reduce each version list in a
+    # single pass, instead of rebuilding both lists once per source
+    pragma_specs = [
+        sources.get_pragma_spec(source, path) for path, source in contract_sources.items()
+    ]
+
+    installed_versions = [i for i in installed_versions if all(i in s for s in pragma_specs)]
+    available_versions = [i for i in available_versions if all(i in s for s in pragma_specs)]
 
     if not available_versions:
         raise IncompatibleSolcVersion("No installable solc version compatible across all sources")
@@ -233,8 +308,11 @@ def find_best_solc_version(
 
 
 def _get_solc_version_list() -> Tuple[List, List]:
-    global AVAILABLE_SOLC_VERSIONS
-    installed_versions = solcx.get_installed_solc_versions()
+    global AVAILABLE_SOLC_VERSIONS, _INSTALLED_SOLC_VERSIONS, _INSTALLED_SOLC_VERSIONS_EXPIRY
+    if _INSTALLED_SOLC_VERSIONS is None or time.time() >= _INSTALLED_SOLC_VERSIONS_EXPIRY:
+        _INSTALLED_SOLC_VERSIONS = solcx.get_installed_solc_versions()
+        _INSTALLED_SOLC_VERSIONS_EXPIRY = time.time() + _INSTALLED_SOLC_VERSIONS_TTL
+    installed_versions = _INSTALLED_SOLC_VERSIONS
     if AVAILABLE_SOLC_VERSIONS is None:
         try:
             AVAILABLE_SOLC_VERSIONS = solcx.get_installable_solc_versions()
@@ -257,6 +335,14 @@ def _get_unique_build_json(
     without_metadata = _remove_metadata(output_evm["deployedBytecode"]["object"])
     instruction_count = len(without_metadata) // 2
 
+    if bytecode:
+        # hash a zero-copy slice of the encoded bytecode rather than building
+        # an intermediate metadata-stripped string
+        idx = -(int(bytecode[-4:], 16) + 2) * 2
+        bytecode_sha1 = sha1(memoryview(bytecode.encode())[:idx]).hexdigest()
+    else:
+        bytecode_sha1 = sha1(b"").hexdigest()
+
     pc_map, statement_map, branch_map = _generate_coverage_data(
         output_evm["deployedBytecode"]["sourceMap"],
         output_evm["deployedBytecode"]["opcodes"],
@@ -278,7 +364,7 @@ def _get_unique_build_json(
     return {
         "allSourcePaths": paths,
         "bytecode": bytecode,
-        "bytecodeSha1": sha1(_remove_metadata(bytecode).encode()).hexdigest(),
+        "bytecodeSha1": bytecode_sha1,
         "coverageMap": {"statements": statement_map, "branches": branch_map},
         "dependencies": dependencies,
         "offset": contract_node.offset,
@@ -293,9 +379,15 @@ def _format_link_references(evm: Dict) -> str:
     references = [
         (k, x) for v in evm["bytecode"].get("linkReferences", {}).values() for k, x in v.items()
     ]
+    if not references:
+        return bytecode
+
+    # splice the library placeholders into a single buffer rather than
+    # rebuilding the full bytecode string once per reference
+    buffer = bytearray(bytecode, "ascii")
     for n, loc in [(i[0], x["start"] * 2) for i in references for x in i[1]]:
-        bytecode = f"{bytecode[:loc]}__{n[:36]:_<36}__{bytecode[loc+40:]}"
-    return bytecode
+        buffer[loc : loc + 40] = f"__{n[:36]:_<36}__".encode()
+    return buffer.decode()
 
 
 def _remove_metadata(bytecode: str) -> str:
@@ -318,27 +410,41 @@ def _generate_coverage_data(
     if not opcodes_str:
         return {}, {}, {}
 
-    source_map = deque(expand_source_map(source_map_str))
-    opcodes = deque(opcodes_str.split(" "))
+    source_map = expand_source_map(source_map_str)
+
+    # opcodes are streamed with a one-token lookahead instead of materializing
+    # a list of every token up front
+    op_iter = (match[0] for match in re.finditer(r"[^ ]+", opcodes_str))
+    next_op = next(op_iter, "")
 
     contract_nodes = [contract_node] + contract_node.dependencies
     source_nodes = {str(i.contract_id): i.parent() for i in contract_nodes}
 
     stmt_nodes = {i: stmt_nodes[i].copy() for i in source_nodes}
+    # statement offsets sorted by start position, so the enclosing statement
+    # can be located with a bisect rather than a scan of the whole set
+    stmt_sorted = {i: sorted(stmt_nodes[i]) for i in source_nodes}
     statement_map: Dict = {i: {} for i in source_nodes}
 
-    # possible branch offsets
-    branch_original = {i: branch_nodes[i].copy() for i in source_nodes}
-    branch_nodes = {i: set(i.offset for i in branch_nodes[i]) for i in source_nodes}
+    # possible branch nodes as {offset: node}, so membership checks and node
+    # lookups are direct
+    branch_nodes = {i: branch_nodes[i] for i in source_nodes}
     # currently active branches, awaiting a jumpi
     branch_active: Dict = {i: {} for i in source_nodes}
-    # branches that have been set
-    branch_set: Dict = {i: {} for i in source_nodes}
+    # branches that have been set, keyed by (contract id, offset) to match
+    # the flat layout used by revert_map
+    branch_set: Dict = {}
 
     count, pc = 0, 0
-    pc_list: List = []
+    # entries are written into the final pc map as they are built - a rolling
+    # window of the last 8 entries covers all required lookbehinds
+    pc_map: Dict = {}
+    recent: deque = deque(maxlen=8)
     revert_map: Dict = {}
-    fallback_hexstr: str = "unassigned"
+    # offsets that have been assigned to at least one op, so the revert-map
+    # finalization does not have to rescan the pc map for every revert node
+    offset_seen: Set = set()
+    fallback_pc: Optional[int] = None
 
     optimizer_revert = False if get_version() >= Version("0.8.0") else True
 
@@ -347,42 +453,70 @@ def _generate_coverage_data(
     active_fn_name: Optional[str] = None
     first_source = source_map[0]
 
+    # memoized AST lookups - these are pure functions of (contract id, offset)
+    # and the same offsets recur constantly within large contracts
+    active_fn_cache: Dict = {}
+    invalid_dev_cache: Dict = {}
+
+    # FunctionDefinition nodes per contract, indexed once per source unit so
+    # locating the active function does not re-traverse the AST
+    fn_nodes_by_id: Dict = {}
+
     while source_map and source_map[-1][2] == -1:
         # trim the end of the source map where there are no contracts associated
         # this is required because sometimes the source map is too long
         # likely a side effect of the YUL optimizer ¯\_(ツ)_/¯
         source_map.pop()
 
-    while source_map:
+    last_map_idx = len(source_map) - 1
+    last: Optional[Dict] = None
+
+    for map_idx, source in enumerate(source_map):
         # format of source_map is [start, stop, contract_id, jump code]
-        source = source_map.popleft()
-        pc_list.append({"op": opcodes.popleft(), "pc": pc})
+        # the current and previous entries are kept in locals, the hot loop
+        # indexes into containers as little as possible
+        op = next_op
+        next_op = next(op_iter, "")
+        prev = last
+        last = {"op": op}
+        op_pc = pc
+        pc_map[op_pc] = last
+        recent.append(last)
 
         if (
             has_fallback is False
-            and fallback_hexstr == "unassigned"
-            and pc_list[-1]["op"] == "REVERT"
-            and [i["op"] for i in pc_list[-4:-1]] == ["JUMPDEST", "PUSH1", "DUP1"]
+            and fallback_pc is None
+            and op == "REVERT"
+            and len(recent) >= 4
+            and prev["op"] == "DUP1"
+            and recent[-3]["op"] == "PUSH1"
+            and recent[-4]["op"] == "JUMPDEST"
         ):
             # flag the REVERT op at the end of the function selector,
             # later reverts may jump to it instead of having their own REVERT op
-            fallback_hexstr = f"0x{hex(pc - 4).upper()[2:]}"
-            pc_list[-1]["first_revert"] = True
+            fallback_pc = op_pc - 4
+            last["first_revert"] = True
 
         if source[3] != "-":
-            pc_list[-1]["jump"] = source[3]
+            last["jump"] = source[3]
 
         pc += 1
-        if pc_list[-1]["op"].startswith("PUSH") and opcodes[0][:2] == "0x":
-            pc_list[-1]["value"] = opcodes.popleft()
-            pc += int(pc_list[-1]["op"][4:])
+        push_value = None
+        if op.startswith("PUSH") and next_op[:2] == "0x":
+            last["value"] = next_op
+            push_value = int(next_op, 16)
+            next_op = next(op_iter, "")
+            pc += int(op[4:])
 
         # for REVERT opcodes without an source offset, try to infer one
         if source[2] == -1 or source == first_source:
-            if pc_list[-1]["op"] == "REVERT":
+            if op == "REVERT":
+                next_source = source_map[map_idx + 1] if map_idx < last_map_idx else None
                 _find_revert_offset(
-                    pc_list, source_map, active_source_node, active_fn_node, active_fn_name
+                    recent, next_source, active_source_node, active_fn_node, active_fn_name
                 )
+                if "offset" in last:
+                    offset_seen.add(last["offset"])
             if source[2] == -1:
                 continue
 
@@ -395,15 +529,16 @@ def _generate_coverage_data(
             continue
 
         active_source_node = source_nodes[contract_id]
-        pc_list[-1]["path"] = contract_id
+        last["path"] = contract_id
 
         # set source offset (-1 means none)
         if source[0] == -1:
             continue
         offset = (source[0], source[0] + source[1])
-        pc_list[-1]["offset"] = offset
+        last["offset"] = offset
+        offset_seen.add(offset)
 
-        if pc_list[-1]["op"] == "REVERT" and not optimizer_revert:
+        if op == "REVERT" and not optimizer_revert:
             # In Solidity >=0.8.0, an optimization is applied to reverts with an error string
             # such that all reverts appear to happen at the same point in the source code.
             # We mark this REVERT as the "optimizer revert" so that when it's encountered in
@@ -412,66 +547,83 @@ def _generate_coverage_data(
                 include_parents=False,
                 include_children=True,
                 required_offset=offset,
-                filters=(
-                    {"nodeType": "FunctionCall", "expression.name": "revert"},
-                    {"nodeType": "FunctionCall", "expression.name": "require"},
-                ),
+                filters=_REVERT_CALL_FILTERS,
             )
             if fn_node:
                 args = len(fn_node[0].arguments)
                 if args == 2 or (fn_node[0].expression.name == "revert" and args):
                     optimizer_revert = True
-                    pc_list[-1]["optimizer_revert"] = True
+                    last["optimizer_revert"] = True
 
         # add error messages for INVALID opcodes
-        if pc_list[-1]["op"] == "INVALID":
-            _set_invalid_error_string(active_source_node, pc_list[-1])
+        if op == "INVALID":
+            if (contract_id, offset) not in invalid_dev_cache:
+                _set_invalid_error_string(active_source_node, last)
+                invalid_dev_cache[(contract_id, offset)] = last.get("dev")
+            elif invalid_dev_cache[(contract_id, offset)] is not None:
+                last["dev"] = invalid_dev_cache[(contract_id, offset)]
 
         # for JUMPI instructions, set active branch markers
-        if branch_active[contract_id] and pc_list[-1]["op"] == "JUMPI":
-            for offset in branch_active[contract_id]:
-                # ( program counter index, JUMPI index)
-                branch_set[contract_id][offset] = (
-                    branch_active[contract_id][offset],
-                    len(pc_list) - 1,
-                )
-            branch_active[contract_id].clear()
+        active_branches = branch_active[contract_id]
+        if active_branches and op == "JUMPI":
+            for offset in active_branches:
+                # ( program counter of the activating op, of the JUMPI )
+                branch_set[(contract_id, offset)] = (active_branches[offset], op_pc)
+            active_branches.clear()
 
         # if op relates to previously set branch marker, clear it
         elif offset in branch_nodes[contract_id]:
-            if offset in branch_set[contract_id]:
-                del branch_set[contract_id][offset]
-            branch_active[contract_id][offset] = len(pc_list) - 1
-
-        try:
-            # set fn name and statement coverage marker
-            if "offset" in pc_list[-2] and offset == pc_list[-2]["offset"]:
-                pc_list[-1]["fn"] = active_fn_name
-            else:
-                active_fn_node, active_fn_name = _get_active_fn(active_source_node, offset)
-                pc_list[-1]["fn"] = active_fn_name
-                stmt_offset = next(
-                    i for i in stmt_nodes[contract_id] if sources.is_inside_offset(offset, i)
-                )
-                stmt_nodes[contract_id].discard(stmt_offset)
-                statement_map[contract_id].setdefault(active_fn_name, {})[count] = stmt_offset
-                pc_list[-1]["statement"] = count
-                count += 1
-        except (KeyError, IndexError, StopIteration):
-            pass
-
-        if pc_list[-1].get("value", None) == fallback_hexstr and opcodes[0] in ("JUMP", "JUMPI"):
-            # track all jumps to the initial revert
-            key = (pc_list[-1]["path"], pc_list[-1]["offset"])
-            revert_map.setdefault(key, []).append(len(pc_list))
-
-    while opcodes[0] not in ("INVALID", "STOP") and pc < instruction_count:
+            branch_set.pop((contract_id, offset), None)
+            active_branches[offset] = op_pc
+
+        if prev is not None:
+            try:
+                # set fn name and statement coverage marker
+                if "offset" in prev and offset == prev["offset"]:
+                    last["fn"] = active_fn_name
+                else:
+                    if (contract_id, offset) in active_fn_cache:
+                        active_fn_node, active_fn_name = active_fn_cache[(contract_id, offset)]
+                    else:
+                        if contract_id not in fn_nodes_by_id:
+                            fn_nodes_by_id[contract_id] = active_source_node.children(
+                                depth=2, filters={"nodeType": "FunctionDefinition"}
+                            )
+                        active_fn_node, active_fn_name = _get_active_fn(
+                            fn_nodes_by_id[contract_id], offset
+                        )
+                        active_fn_cache[(contract_id, offset)] = (active_fn_node, active_fn_name)
+                    last["fn"] = active_fn_name
+                    stmt_offset = _find_statement_offset(
+                        stmt_sorted[contract_id], stmt_nodes[contract_id], offset
+                    )
+                    if stmt_offset is not None:
+                        stmt_nodes[contract_id].discard(stmt_offset)
+                        statement_map[contract_id].setdefault(active_fn_name, {})[
+                            count
+                        ] = stmt_offset
+                        last["statement"] = count
+                        count += 1
+            except (KeyError, IndexError, StopIteration):
+                pass
+
+        if fallback_pc is not None and push_value == fallback_pc and next_op in _JUMP_OPS:
+            # track all jumps to the initial revert - `pc` already points at
+            # the next instruction, the one that performs the jump
+            key = (last["path"], last["offset"])
+            revert_map.setdefault(key, []).append(pc)
+
+    while next_op and next_op not in _TERMINAL_OPS and pc < instruction_count:
         # necessary because sometimes solidity returns an incomplete source map
-        pc_list.append({"op": opcodes.popleft(), "pc": pc})
+        op = next_op
+        next_op = next(op_iter, "")
+        last = {"op": op}
+        pc_map[pc] = last
         pc += 1
-        if pc_list[-1]["op"].startswith("PUSH") and opcodes[0][:2] == "0x":
-            pc_list[-1]["value"] = opcodes.popleft()
-            pc += int(pc_list[-1]["op"][4:])
+        if op.startswith("PUSH") and next_op[:2] == "0x":
+            last["value"] = next_op
+            next_op = next(op_iter, "")
+            pc += int(op[4:])
 
     # compare revert and require statements against the map of revert jumps
     for (contract_id, fn_offset), values in revert_map.items():
@@ -481,55 +633,65 @@ def _generate_coverage_data(
             required_offset=fn_offset,
             filters={"nodeType": "FunctionDefinition"},
         )[0]
-        revert_nodes = fn_node.children(
-            filters=(
-                {"nodeType": "FunctionCall", "expression.name": "revert"},
-                {"nodeType": "FunctionCall", "expression.name": "require"},
-            )
-        )
+        revert_nodes = fn_node.children(filters=_REVERT_CALL_FILTERS)
         for node in revert_nodes:
             offset = node.offset
             # if the node offset is not in the source map, apply it's offset to the JUMPI op
-            if not next((x for x in pc_list if "offset" in x and x["offset"] == offset), False):
-                pc_list[values[0]].update(offset=offset, jump_revert=True)
+            if offset not in offset_seen:
+                pc_map[values[0]].update(offset=offset, jump_revert=True)
+                offset_seen.add(offset)
                 del values[0]
 
     # set branch index markers and build final branch map
     branch_map: Dict = {i: {} for i in source_nodes}
-    for path, offset, idx in [(k, x, y) for k, v in branch_set.items() for x, y in v.items()]:
+    for (path, offset), branch_pc in branch_set.items():
         # for branch to be hit, need an op relating to the source and the next JUMPI
         # this is because of how the compiler optimizes nested BinaryOperations
-        if "fn" in pc_list[idx[0]]:
-            fn = pc_list[idx[0]]["fn"]
-            pc_list[idx[0]]["branch"] = count
-            pc_list[idx[1]]["branch"] = count
-            node = next(i for i in branch_original[path] if i.offset == offset)
+        if "fn" in pc_map[branch_pc[0]]:
+            fn = pc_map[branch_pc[0]]["fn"]
+            pc_map[branch_pc[0]]["branch"] = count
+            pc_map[branch_pc[1]]["branch"] = count
+            node = branch_nodes[path][offset]
             branch_map[path].setdefault(fn, {})[count] = offset + (node.jump,)
             count += 1
 
-    pc_map = {i.pop("pc"): i for i in pc_list}
     return pc_map, statement_map, branch_map
 
 
+def _find_statement_offset(
+    sorted_offsets: List, remaining: Set, offset: Tuple[int, int]
+) -> Optional[Tuple[int, int]]:
+    # locate an unclaimed statement offset that contains the given source offset,
+    # bisecting to the last statement that starts at or before it and walking left
+    for idx in range(bisect_left(sorted_offsets, (offset[0] + 1,)) - 1, -1, -1):
+        stmt_offset = sorted_offsets[idx]
+        if stmt_offset[1] >= offset[1] and stmt_offset in remaining:
+            return stmt_offset
+    return None
+
+
 def _find_revert_offset(
-    pc_list: List,
-    source_map: deque,
+    recent: deque,
+    next_source: Optional[List],
     source_node: NodeBase,
     fn_node: NodeBase,
     fn_name: Optional[str],
 ) -> None:
 
     # attempt to infer a source offset for reverts that do not have one
+    # `recent` is a window of the last 8 pc map entries, ending with the
+    # REVERT op itself, and `next_source` is the source map entry for the
+    # next instruction, or None if this is the last instruction
 
-    if source_map:
+    if next_source is not None:
         # is not the last instruction
-        if len(pc_list) >= 8 and pc_list[-8]["op"] == "CALLVALUE":
+        if len(recent) >= 8 and recent[-8]["op"] == "CALLVALUE":
             # reference to CALLVALUE 8 instructions previous is a nonpayable function check
-            pc_list[-1].update(
+            recent[-1].update(
                 dev="Cannot send ether to nonpayable function",
-                fn=pc_list[-8].get("fn", "<unknown>"),
-                offset=pc_list[-8].get("offset"),
-                path=pc_list[-8].get("path"),
+                fn=recent[-8].get("fn", "<unknown>"),
+                offset=recent[-8].get("offset"),
+                path=recent[-8].get("path"),
             )
             return
 
@@ -539,9 +701,9 @@ def _find_revert_offset(
 
     # get the offset of the next instruction
     next_offset = None
-    if source_map and source_map[0][2] != -1:
+    if next_source is not None and next_source[2] != -1:
 
-        next_offset = (source_map[0][0], source_map[0][0] + source_map[0][1])
+        next_offset = (next_source[0], next_source[0] + next_source[1])
 
     # if the next instruction offset is not equal to the offset of the active function,
     # but IS contained within the active function, apply this offset to the current
@@ -552,7 +714,7 @@ def _find_revert_offset(
         and next_offset != fn_node.offset
         and is_inside_offset(next_offset, fn_node.offset)
     ):
-        pc_list[-1].update(path=str(source_node.contract_id), fn=fn_name, offset=next_offset)
+        recent[-1].update(path=str(source_node.contract_id), fn=fn_name, offset=next_offset)
         return
 
     # if any of the previous conditions are not satisfied, this is the final revert
@@ -560,8 +722,8 @@ def _find_revert_offset(
     if fn_node[-1].nodeType == "ExpressionStatement":
         expr = fn_node[-1].expression
 
-        if expr.nodeType == "FunctionCall" and expr.get("expression.name") in ("revert", "require"):
-            pc_list[-1].update(
+        if expr.nodeType == "FunctionCall" and expr.get("expression.name") in _REVERT_FN_NAMES:
+            recent[-1].update(
                 path=str(source_node.contract_id), fn=fn_name, offset=expr.expression.offset
             )
 
@@ -581,10 +743,11 @@ def _set_invalid_error_string(source_node: NodeBase, pc_map: Dict) -> None:
             pc_map["dev"] = "Modulus by zero"
 
 
-def _get_active_fn(source_node: NodeBase, offset: Tuple[int, int]) -> Tuple[NodeBase, str]:
-    fn_node = source_node.children(
-        depth=2, required_offset=offset, filters={"nodeType": "FunctionDefinition"}
-    )[0]
+def _get_active_fn(fn_nodes: List, offset: Tuple[int, int]) -> Tuple[NodeBase, str]:
+    # `fn_nodes` contains every FunctionDefinition node of the source unit,
+    # indexed in a single traversal - functions cannot nest so at most one
+    # of them contains the given offset
+    fn_node = next(i for i in fn_nodes if is_inside_offset(offset, i.offset))
     name = getattr(fn_node, "name", None)
     if not name:
         if getattr(fn_node, "kind", "function") != "function":
@@ -625,24 +788,18 @@ def _get_statement_nodes(source_nodes: Dict) -> Dict:
 
 
 def _get_branch_nodes(source_nodes: List) -> Dict:
-    # Given a list of source nodes, returns a dict of lists of nodes corresponding
-    # to possible branches in the code
+    # Given a list of source nodes, returns a dict of {offset: node} for nodes
+    # corresponding to possible branches in the code
     branches: Dict = {}
     for node in source_nodes:
-        branches[str(node.contract_id)] = set()
+        branches[str(node.contract_id)] = {}
         for contract_node in node.children(depth=1, filters={"nodeType": "ContractDefinition"}):
             for child_node in [
-                x
-                for i in contract_node
-                for x in i.children(
-                    filters=(
-                        {"nodeType": "FunctionCall", "expression.name": "require"},
-                        {"nodeType": "IfStatement"},
-                        {"nodeType": "Conditional"},
-                    )
-                )
+                x for i in contract_node for x in i.children(filters=_BRANCH_BASE_FILTERS)
             ]:
-                branches[str(node.contract_id)] |= _get_recursive_branches(child_node)
+                branches[str(node.contract_id)].update(
+                    (i.offset, i) for i in _get_recursive_branches(child_node)
+                )
     return branches
 
 
@@ -652,14 +809,35 @@ def _get_recursive_branches(base_node: Any) -> Set:
     # for IfStatement, jumping indicates evaluating false
     jump_is_truthful = base_node.nodeType != "IfStatement"
 
-    filters = (
-        {"nodeType": "BinaryOperation", "typeDescriptions.typeString": "bool", "operator": "||"},
-        {"nodeType": "BinaryOperation", "typeDescriptions.typeString": "bool", "operator": "&&"},
-    )
-    all_binaries = node.children(include_parents=True, include_self=True, filters=filters)
+    # walk the condition subtree once, depth-first. each entry records a node,
+    # the index of its parent, whether it is an operand of an `||` or `&&`
+    # operation, and its inherited jump value - set by the operator of the
+    # nearest boolean BinaryOperation ancestor the node is on the left side of
+    walked = [(node, -1, False, jump_is_truthful)]
+    has_branch_op = []
+    idx = 0
+    while idx < len(walked):
+        current, _, _, jump = walked[idx]
+        if (
+            current.nodeType == "BinaryOperation"
+            and current.get("typeDescriptions.typeString") == "bool"
+        ):
+            is_operand = current.operator in ("||", "&&")
+            has_branch_op.append(is_operand)
+            walked.append((current.leftExpression, idx, is_operand, current.operator == "||"))
+            walked.append((current.rightExpression, idx, is_operand, jump))
+        else:
+            has_branch_op.append(False)
+            walked.extend((child, idx, False, jump) for child in current._children)
+        idx += 1
+
+    # propagate upward, so each entry knows if its subtree holds an operation
+    for idx in range(len(walked) - 1, 0, -1):
+        if has_branch_op[idx]:
+            has_branch_op[walked[idx][1]] = True
 
-    # if no BinaryOperation nodes are found, this node is the branch
-    if not all_binaries:
+    # if no boolean operations were found, this node is the branch
+    if not has_branch_op[0]:
         # if node is FunctionCall, look at the first argument
         if base_node.nodeType == "FunctionCall":
             node = node.arguments[0]
@@ -669,40 +847,14 @@ def _get_recursive_branches(base_node: Any) -> Set:
         node.jump = jump_is_truthful
         return set([node])
 
-    # look at children of BinaryOperation nodes to find all possible branches
+    # operands that do not contain nested operations are the possible branches
     binary_branches = set()
-    for node in (x for i in all_binaries for x in (i.leftExpression, i.rightExpression)):
-        if node.children(include_self=True, filters=filters):
+    for idx, (current, _, is_operand, jump) in enumerate(walked):
+        if not is_operand or has_branch_op[idx]:
             continue
-        _jump = jump_is_truthful
-        if not _is_rightmost_operation(node, base_node.depth):
-            _jump = _check_left_operator(node, base_node.depth)
-        if node.nodeType == "UnaryOperation":
-            node = node.subExpression
-        node.jump = _jump
-        binary_branches.add(node)
+        if current.nodeType == "UnaryOperation":
+            current = current.subExpression
+        current.jump = jump
+        binary_branches.add(current)
 
     return binary_branches
-
-
-def _is_rightmost_operation(node: NodeBase, depth: int) -> bool:
-    # Check if the node is the final operation within the expression
-    parents = node.parents(
-        depth, {"nodeType": "BinaryOperation", "typeDescriptions.typeString": "bool"}
-    )
-    return not next(
-        (i for i in parents if i.leftExpression == node or node.is_child_of(i.leftExpression)),
-        False,
-    )
-
-
-def _check_left_operator(node: NodeBase, depth: int) -> bool:
-    # Find the nearest parent boolean where this node sits on the left side of
-    # the comparison, and return True if that node's operator is ||
-    parents = node.parents(
-        depth, {"nodeType": "BinaryOperation", "typeDescriptions.typeString": "bool"}
-    )
-    op = next(
-        i for i in parents if i.leftExpression == node or node.is_child_of(i.leftExpression)
-    ).operator
-    return op == "||"
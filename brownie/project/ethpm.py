@@ -487,17 +487,26 @@ def create_manifest(
         manifest["contract_types"][contract_name] = _get_contract_type(build_json, relative_to)
 
     # add contract_types from interfaces/
-    for path in _get_path_list(project_path, "interfaces", True):
+    interface_paths = _get_path_list(project_path, "interfaces", True)
+
+    # solidity interfaces are compiled in a single batch, grouped by compatible
+    # solc version, instead of invoking the compiler once per source file
+    solidity_sources = {}
+    for path in [i for i in interface_paths if i.suffix == ".sol"]:
+        with path.open() as fp:
+            solidity_sources[path.as_posix()] = fp.read()
+    solidity_abis = compiler.solidity.get_abi(solidity_sources) if solidity_sources else {}
+
+    for path in interface_paths:
         if path.suffix == ".json":
             with path.open() as fp:
                 data = {path.stem: json.load(fp)}
+        elif path.suffix == ".sol":
+            data = solidity_abis[path.as_posix()]
         else:
             with path.open() as fp:
                 source = fp.read()
-            if path.suffix == ".sol":
-                data = compiler.solidity.get_abi(source)
-            else:
-                data = compiler.vyper.get_abi(source, path.stem)
+            data = compiler.vyper.get_abi(source, path.stem)
         for name, abi in data.items():
             build_json = {
                 "abi": abi,
@@ -2,6 +2,7 @@
 
 import re
 import textwrap
+from functools import lru_cache
 from hashlib import sha1
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -199,11 +200,15 @@ def get_contract_names(full_source: str) -> List:
     return contract_names
 
 
+@lru_cache(maxsize=None)
 def get_pragma_spec(source: str, path: Optional[str] = None) -> NpmSpec:
 
     """
     Extracts pragma information from Solidity source code.
 
+    Results are cached, as the same source is commonly queried several times
+    while determining compiler versions.
+
     Args:
         source: Solidity source code
         path: Optional path to the source (only used for error reporting)
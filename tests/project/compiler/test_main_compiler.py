@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 
 import pytest
+import solcx
 
 from brownie.exceptions import UnsupportedLanguage
 from brownie.project import compiler
@@ -17,6 +18,24 @@ def test_multiple_compilers(solc4source, vysource):
     )
 
 
+def test_serial_compile_uses_each_version(monkeypatch):
+    compiled_versions = []
+
+    def patched_compile(input_json, silent=True, allow_paths=None):
+        compiled_versions.append(str(solcx.get_solc_version().truncate()))
+        return {"contracts": {}, "sources": {}}
+
+    monkeypatch.setattr("brownie.project.compiler.compile_from_input_json", patched_compile)
+    compiler.compile_and_format(
+        {
+            "foo.sol": "pragma solidity 0.5.7; contract Foo {}",
+            "bar.sol": "pragma solidity 0.6.2; contract Bar {}",
+        },
+        silent=False,
+    )
+    assert sorted(compiled_versions) == ["0.5.7", "0.6.2"]
+
+
 def test_wrong_suffix():
     with pytest.raises(UnsupportedLanguage):
         compiler.compile_and_format({"foo.bar": ""})
@@ -52,6 +52,7 @@ def msolc(monkeypatch):
         Version("0.4.6"),
     ]
     monkeypatch.setattr("solcx.get_installed_solc_versions", lambda: installed)
+    monkeypatch.setattr("brownie.project.compiler.solidity._INSTALLED_SOLC_VERSIONS", None)
     monkeypatch.setattr("solcx.install_solc", lambda k, **z: installed.append(k))
     monkeypatch.setattr(
         "solcx.get_installable_solc_versions",
@@ -99,6 +100,12 @@ def test_generate_input_json_evm(solc5source, monkeypatch):
     assert fn(evm_version="petersburg")["settings"]["evmVersion"] == "petersburg"
 
 
+@pytest.mark.parametrize("original,translated", EVM_EQUIVALENTS.items())
+def test_generate_input_json_evm_translates(solc5source, original, translated):
+    input_json = compiler.generate_input_json({"path.sol": solc5source}, evm_version=original)
+    assert input_json["settings"]["evmVersion"] == translated
+
+
 def test_compile_input_json(solc5json):
     assert "Foo" in solc5json["contracts"]["path.sol"]
     assert "Bar" in solc5json["contracts"]["path.sol"]
@@ -217,6 +224,18 @@ def test_get_abi():
     ]
 
 
+def test_get_abi_dict():
+    foo = "pragma solidity 0.5.0; contract Foo { function baz() external returns (bool); }"
+    bar = "pragma solidity 0.6.2; contract Bar { function baz() external pure {} }"
+    abi = compiler.solidity.get_abi(
+        {"foo.sol": foo, "bar.sol": bar, "empty.sol": "pragma solidity 0.5.0;"}
+    )
+    assert sorted(abi) == ["bar.sol", "empty.sol", "foo.sol"]
+    assert abi["empty.sol"] == {}
+    assert [i["name"] for i in abi["foo.sol"]["Foo"]] == ["baz"]
+    assert [i["name"] for i in abi["bar.sol"]["Bar"]] == ["baz"]
+
+
 def test_size_limit(capfd):
     code = f"""
 pragma solidity 0.6.2;